@@ -1,29 +1,74 @@
+import atexit
 import csv
+import io
+import mmap
 import os
+import sys
+from typing import Union
 
 # --- Constants ---
 GARAGE_FILE = "garage.csv"
+# Header row written at the top of every garage file.
+CSV_HEADER = ("color", "year", "make", "model")
+# Write buffer size (in bytes) used when saving the garage file.
+WRITE_BUFFER_SIZE = 65536
+# Number of unsaved changes allowed before the garage is written to disk.
+FLUSH_INTERVAL = 16
+# Text encoding used for every read and write of the garage file.
+FILE_ENCODING = "utf-8"
+# Files larger than this (in bytes) are loaded through a memory map instead of the csv module.
+MMAP_THRESHOLD = 1024 * 1024
+# Garages larger than this delete by swapping with the last car, which does not preserve order.
+SWAP_DELETE_THRESHOLD = 10000
 
 # --- Class Definitions ---
 class Car:
     """Represents a single car with its attributes."""
 
-    def __init__(self, color: str, year: int, make: str, model: str):
-        self.color = color
-        # Store the year as an integer for potential future operations (e.g., sorting).
-        self.year = year
-        self.make = make
-        self.model = model
+    # Fixed attribute slots avoid a per-instance __dict__, reducing memory per car.
+    __slots__ = ("color", "_year", "make", "model", "_str")
+
+    def __init__(self, color: str, year: Union[str, int], make: str, model: str):
+        # Colors, makes and models repeat across many cars, so intern them to share one copy.
+        self.color = sys.intern(color)
+        # Keep the year as given (text when read from a file); it is only parsed when accessed.
+        self._year = year
+        self.make = sys.intern(make)
+        self.model = sys.intern(model)
+        # Cached display string, built the first time the car is printed.
+        self._str = None
 
     def __str__(self):
         """Provides a user-friendly string representation of the Car object."""
-        return f"{self.color} {self.year} {self.make} {self.model}"
+        # Cars are not modified after creation, so the formatted string never goes stale.
+        if self._str is None:
+            self._str = f"{self.color} {self._year} {self.make} {self.model}"
+        return self._str
+
+    @property
+    def year(self) -> int:
+        """The model year as an integer, converted from text on first access."""
+        if isinstance(self._year, str):
+            self._year = int(self._year)
+        return self._year
+
+    def as_row(self) -> tuple:
+        """Returns the car as a CSV row, keeping the year exactly as it was given."""
+        return (self.color, self._year, self.make, self.model)
+
+    def _comparable_year(self) -> Union[str, int]:
+        """Returns the year as an int, or as its raw text if it is not a number."""
+        try:
+            return self.year
+        except ValueError:
+            return self._year
 
     def __eq__(self, other):
         """Allows for direct comparison of two Car objects."""
         if not isinstance(other, Car):
             return NotImplemented
-        return self.__dict__ == other.__dict__
+        return (self.color, self._comparable_year(), self.make, self.model) == (
+            other.color, other._comparable_year(), other.make, other.model)
 
 class Garage:
     """Manages a collection of Car objects and handles persistence via a CSV file."""
@@ -31,67 +76,215 @@ class Garage:
     def __init__(self):
         """Initializes an empty list to hold car objects."""
         self.cars = []
+        # Count unsaved changes so the file is only rewritten when needed.
+        self.pending_changes = 0
+        # The file the leading `_saved_count` cars are known to be stored in, or None
+        # if that is unknown and the next save must rewrite the whole file.
+        self._saved_path = None
+        self._saved_count = 0
 
     def load(self, file_path: str):
         """Loads car data from a CSV file into the garage."""
-        if not os.path.exists(file_path):
-            print("Garage file not found. Starting with an empty garage.")
-            return
-
+        # Cars already in the garage are not in this file, so they stay unsaved.
+        was_empty = not self.cars
         try:
-            # Open the file in read mode ('r').
-            with open(file_path, mode='r', newline='') as f:
-                reader = csv.reader(f)
-                try:
-                    # Skip the header row to avoid creating a car from it.
-                    next(reader)
-                except StopIteration:
-                    # This occurs if the file is empty (e.g., only has a header), which is fine.
-                    return
-
-                for row in reader:
-                    if row:  # Ensure the row is not empty.
-                        # Create a new Car object from the row data.
-                        new_car = Car(color=row[0], year=int(row[1]), make=row[2], model=row[3])
-                        self.cars.append(new_car)
-            print("Garage loaded successfully.")
+            # Open the file once; a missing file is reported by open() itself.
+            with open(file_path, mode='rb') as f:
+                # Large files are scanned as raw bytes; small ones use the csv module.
+                if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD or not self._load_mmap(f):
+                    loaded = self._load_csv(f)
+                else:
+                    loaded = True
+            if was_empty:
+                self._mark_saved(file_path)
+            if loaded:
+                print("Garage loaded successfully.")
+        except FileNotFoundError:
+            print("Garage file not found. Starting with an empty garage.")
         except (IOError, IndexError, ValueError) as e:
             # Catch potential errors from a corrupted file and start fresh.
             print(f"Error reading from {file_path}: {e}. Starting with an empty garage.")
             self.cars = []
 
+    def _load_csv(self, f) -> bool:
+        """Reads cars from an open binary file with the csv module. Returns False if it is empty."""
+        # Decode the binary file as text in the same way open(..., newline='') would.
+        with io.TextIOWrapper(f, newline='', encoding=FILE_ENCODING) as text:
+            reader = csv.reader(text)
+            try:
+                # Skip the header row to avoid creating a car from it.
+                next(reader)
+            except StopIteration:
+                # This occurs if the file is empty (e.g., only has a header), which is fine.
+                return False
+
+            # Bind the hot names locally to avoid repeated lookups inside the loop.
+            append = self.cars.append
+            car_cls = Car
+            for row in reader:
+                if row:  # Ensure the row is not empty.
+                    # Unpacking raises ValueError if the row has the wrong number of columns.
+                    color, year, make, model = row
+                    append(car_cls(color, year, make, model))
+        return True
+
+    def _load_mmap(self, f) -> bool:
+        """
+        Reads cars by scanning an open binary file, memory-mapped, for newlines
+        and commas. Returns False without loading anything if the file contains
+        quoted fields, which only the csv module can parse correctly.
+        """
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"') != -1:
+                return False
+
+            # Skip the header row to avoid creating a car from it.
+            pos = mm.find(b'\n') + 1
+            if pos == 0:
+                return True
+
+            size = len(mm)
+            # Pre-size the list from the file size (roughly 40 bytes per row) to avoid
+            # repeated reallocation while appending; it grows by the same step if needed.
+            step = max(16, size // 40)
+            cars = [None] * step
+            count = 0
+            car_cls = Car
+            while pos < size:
+                end = mm.find(b'\n', pos)
+                if end == -1:
+                    end = size
+                line = mm[pos:end].rstrip(b'\r')
+                pos = end + 1
+                if line:  # Ensure the row is not empty.
+                    color, year, make, model = line.split(b',')
+                    if count == len(cars):
+                        cars.extend([None] * step)
+                    cars[count] = car_cls(
+                        color.decode(FILE_ENCODING), year.decode(FILE_ENCODING),
+                        make.decode(FILE_ENCODING), model.decode(FILE_ENCODING))
+                    count += 1
+
+        del cars[count:]
+        if self.cars:
+            self.cars.extend(cars)
+        else:
+            self.cars = cars
+        return True
+
     def add_car(self, car: Car):
         """Adds a Car object to the list."""
         self.cars.append(car)
+        self.pending_changes += 1
 
     def remove_car(self, car_index: int) -> Car:
-        """Removes a car by its 0-based index and returns it."""
-        return self.cars.pop(car_index)
+        """
+        Removes a car by its 0-based index and returns it. Small garages keep
+        their order; above SWAP_DELETE_THRESHOLD the last car is moved into the
+        freed slot so no other cars need to be shifted.
+        """
+        cars = self.cars
+        last = len(cars) - 1
+        if last >= SWAP_DELETE_THRESHOLD and car_index != last:
+            # The right-hand side is read first, so an invalid index raises before anything moves.
+            cars[car_index], cars[last] = cars[last], cars[car_index]
+            removed = cars.pop()
+        else:
+            removed = cars.pop(car_index)
+        self.pending_changes += 1
+        # Rows already in the file have shifted, so only a full rewrite is correct now.
+        self._saved_path = None
+        return removed
+
+    def _mark_saved(self, file_path: str):
+        """Records that every car in the garage is now stored in the given file."""
+        self.pending_changes = 0
+        self._saved_path = file_path
+        self._saved_count = len(self.cars)
+
+    def flush(self, file_path: str):
+        """
+        Saves the garage only if it has unsaved changes. If cars have only been
+        added since the file was last loaded or saved, just the new rows are
+        appended; otherwise the whole file is rewritten.
+        """
+        if not self.pending_changes:
+            return
+        if file_path != self._saved_path:
+            self.save(file_path)
+            return
+        try:
+            self._append_rows(self.cars[self._saved_count:], file_path)
+            self._mark_saved(file_path)
+            print("Garage saved successfully.")
+        except IOError as e:
+            print(f"Error saving garage to {file_path}: {e}")
 
     def save(self, file_path: str):
         """Saves the current list of cars to a CSV file."""
         try:
-            # Open the file in 'write' mode.
-            with open(file_path, mode='w', newline='') as f:
-                writer = csv.writer(f)
-                # Write the header first for clarity and portability.
-                writer.writerow(["color", "year", "make", "model"])
-                # Write the data for each car object in the list.
-                for car_obj in self.cars:
-                    writer.writerow([car_obj.color, car_obj.year, car_obj.make, car_obj.model])
+            # Build the whole file in memory so csv quoting is kept but the disk sees one write.
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            # Write the header first for clarity and portability.
+            writer.writerow(CSV_HEADER)
+            # Write all car rows in one call so the csv module loops internally.
+            # The raw year is written so unparsed years are never converted just to be saved.
+            writer.writerows([c.as_row() for c in self.cars])
+            # Open the file in 'write' mode with a larger buffer than the default.
+            with open(file_path, mode='w', newline='', buffering=WRITE_BUFFER_SIZE,
+                      encoding=FILE_ENCODING) as f:
+                f.write(buffer.getvalue())
+            self._mark_saved(file_path)
             print("Garage saved successfully.")
         except IOError as e:
             print(f"Error saving garage to {file_path}: {e}")
 
+    def _append_rows(self, cars: list, file_path: str):
+        """Appends cars to the end of a CSV file, writing the header only if the file is new."""
+        # Open the file in 'append' mode so only the new rows are written; it is also
+        # readable so the last byte can be checked for a missing line ending.
+        with open(file_path, mode='a+b') as raw:
+            size = raw.seek(0, os.SEEK_END)
+            ends_with_newline = True
+            if size:
+                raw.seek(-1, os.SEEK_END)
+                ends_with_newline = raw.read(1) == b'\n'
+            # Writes in append mode always go to the end of the file, whatever the position.
+            with io.TextIOWrapper(raw, newline='', encoding=FILE_ENCODING) as f:
+                writer = csv.writer(f)
+                if size == 0:
+                    writer.writerow(CSV_HEADER)
+                elif not ends_with_newline:
+                    # Finish the last line so the first new row does not join onto it.
+                    f.write(writer.dialect.lineterminator)
+                writer.writerows([c.as_row() for c in cars])
+
 # --- User Interface Functions ---
+# ANSI sequence that clears the terminal and moves the cursor to the top-left corner.
+CLEAR_SCREEN_SEQUENCE = "\x1b[2J\x1b[H"
+
+def enable_ansi_escapes():
+    """Turns on ANSI escape sequence support in the Windows console (no-op elsewhere)."""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # -11 is STD_OUTPUT_HANDLE; 0x0004 is ENABLE_VIRTUAL_TERMINAL_PROCESSING.
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_ulong()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except (ImportError, AttributeError, OSError):
+        # Older consoles without VT support will simply print the raw sequence.
+        pass
+
 # Clear screen in terminal view
 def clear_screen():
-    # For Windows
-    if os.name == 'nt':
-        _ = os.system('cls')
-    # For macOS and Linux
-    else:
-        _ = os.system('clear')
+    # Write the escape sequence directly instead of spawning a 'cls'/'clear' process.
+    sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+    sys.stdout.flush()
 
 def prompt_for_new_car() -> Car:
     """Handles the user interface for creating a new car."""
@@ -114,12 +307,12 @@ def prompt_for_new_car() -> Car:
 
 def list_cars(garage: Garage):
     """Displays the list of cars currently in the garage."""
-    print("Cars in Garage: ")
-    if not garage.cars:
-        print("The garage is empty.")
-    else:
-        for i, car_obj in enumerate(garage.cars):
-            print(f"{i + 1}. {car_obj}")
+    # Collect every line first so the whole listing goes out in a single write.
+    lines = ["Cars in Garage: "]
+    lines.extend(f"{i}. {car_obj}" for i, car_obj in enumerate(garage.cars, start=1))
+    if len(lines) == 1:
+        lines.append("The garage is empty.")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def delete_car(garage: Garage):
     """Handles the user interface flow for deleting a car."""
@@ -136,7 +329,6 @@ def delete_car(garage: Garage):
             # Use the remove_car method, adjusting for 0-based index
             deleted_car = garage.remove_car(car_num_to_delete - 1)
             print(f"\nCar '{deleted_car}' deleted successfully.")
-            garage.save(GARAGE_FILE)
         else:
             print("Invalid car number.")
     except ValueError:
@@ -145,11 +337,19 @@ def delete_car(garage: Garage):
 # --- Main Application Logic ---
 def main():
     """Main function to run the garage management application."""
+    enable_ansi_escapes()
     my_garage = Garage()
     my_garage.load(GARAGE_FILE)
+    # Persist any unsaved changes even if the program exits unexpectedly.
+    atexit.register(my_garage.flush, GARAGE_FILE)
 
+    # Only redraw on a clean screen after the garage changes, so messages such as
+    # "Invalid choice" stay visible until the user has read them.
+    needs_clear = True
     while True:
-        clear_screen()
+        if needs_clear:
+            clear_screen()
+            needs_clear = False
 
         print("\n--------- GARAGE MAIN MENU ---------")
         print("1. Add Car")
@@ -163,21 +363,28 @@ def main():
         if choice == "1":
             new_car = prompt_for_new_car()
             my_garage.add_car(new_car)
-            my_garage.save(GARAGE_FILE)
             print(f"\nCar '{new_car}' added to the garage.")
+            needs_clear = True
 
         elif choice == "2":
             list_cars(my_garage)
 
         elif choice == "3":
+            car_count = len(my_garage.cars)
             delete_car(my_garage)
+            needs_clear = len(my_garage.cars) != car_count
 
         elif choice == "4":
+            my_garage.flush(GARAGE_FILE)
             print("Exiting program.")
             break
         else:
             print("Invalid choice. Please try again.")
 
+        # Bound the amount of work that could be lost between saves.
+        if my_garage.pending_changes >= FLUSH_INTERVAL:
+            my_garage.flush(GARAGE_FILE)
+
 # --- Script Entry Point ---
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pytest
-from garage.garage import Car, Garage, prompt_for_new_car, list_cars, delete_car
+from garage import garage as garage_module
+from garage.garage import Car, Garage, prompt_for_new_car, list_cars, delete_car, clear_screen, main
 
 # --- Fixtures ---
 @pytest.fixture
@@ -32,6 +33,43 @@ class TestCar:
         """Tests the __str__ method to ensure it's human-readable."""
         assert str(sample_car) == "Red 2022 Ford Mustang"
 
+    def test_car_str_is_cached(self, sample_car):
+        """Tests that repeated __str__ calls reuse the same formatted string."""
+        assert str(sample_car) is str(sample_car)
+
+    def test_car_year_parsed_on_access(self):
+        """Tests that a year given as text is displayed as-is and read back as an int."""
+        car = Car("Red", "2022", "Ford", "Mustang")
+        assert str(car) == "Red 2022 Ford Mustang"
+        assert car.year == 2022
+        assert car == Car("Red", 2022, "Ford", "Mustang")
+
+    def test_car_as_row_keeps_raw_year(self):
+        """Tests that as_row returns the year unconverted, ready to be written to CSV."""
+        assert Car("Red", "2022", "Ford", "Mustang").as_row() == ("Red", "2022", "Ford", "Mustang")
+
+    def test_car_equality_non_numeric_year(self):
+        """Tests that cars with a non-numeric year can still be compared."""
+        car = Car("Red", "abc", "Ford", "Mustang")
+        assert car == Car("Red", "abc", "Ford", "Mustang")
+        assert car != Car("Red", 2022, "Ford", "Mustang")
+
+    def test_car_equality(self, sample_car):
+        """Tests that cars with the same attributes compare equal."""
+        assert sample_car == Car("Red", 2022, "Ford", "Mustang")
+        assert sample_car != Car("Red", 2021, "Ford", "Mustang")
+
+    def test_car_strings_are_interned(self):
+        """Tests that equal color/make/model strings are shared between cars."""
+        first = Car("".join(["Bl", "ack"]), 2020, "".join(["Fo", "rd"]), "F-150")
+        second = Car("".join(["Bla", "ck"]), 2021, "".join(["For", "d"]), "F-150")
+        assert first.color is second.color
+        assert first.make is second.make
+
+    def test_car_has_no_instance_dict(self, sample_car):
+        """Tests that Car uses __slots__ instead of a per-instance __dict__."""
+        assert not hasattr(sample_car, "__dict__")
+
 
 class TestGarage:
     """Groups tests related to the Garage class logic and persistence."""
@@ -55,6 +93,20 @@ class TestGarage:
         # Assert that the remaining car in the garage is the Rivian.
         assert populated_garage.cars[0].make == "Rivian"
 
+    def test_remove_car_large_garage_swaps_last(self, monkeypatch):
+        """Tests that large garages fill the removed slot with the last car."""
+        monkeypatch.setattr(garage_module, "SWAP_DELETE_THRESHOLD", 2)
+        g = Garage()
+        for make in ["Ford", "Tesla", "Rivian", "Honda"]:
+            g.add_car(Car("Red", 2022, make, "Model"))
+
+        deleted_car = g.remove_car(0)
+
+        assert deleted_car.make == "Ford"
+        assert [c.make for c in g.cars] == ["Honda", "Tesla", "Rivian"]
+        with pytest.raises(IndexError):
+            g.remove_car(99)
+
     def test_remove_car_invalid_index(self, populated_garage):
         """Tests removing a car with an out-of-bounds index raises an IndexError."""
         with pytest.raises(IndexError):
@@ -78,6 +130,144 @@ class TestGarage:
         assert len(new_garage.cars) == len(populated_garage.cars)
         assert new_garage.cars == populated_garage.cars
 
+    def test_flush_saves_only_when_dirty(self, populated_garage, tmp_path):
+        """Tests that flush writes pending changes once and then becomes a no-op."""
+        file_path = tmp_path / "test_garage.csv"
+        populated_garage.flush(file_path)
+        assert file_path.exists()
+        assert populated_garage.pending_changes == 0
+
+        file_path.unlink()
+        populated_garage.flush(file_path)  # Nothing changed, so nothing is written.
+        assert not file_path.exists()
+
+        populated_garage.remove_car(0)
+        assert populated_garage.pending_changes == 1
+        populated_garage.flush(file_path)
+        assert file_path.exists()
+
+    def test_load_mmap_path(self, populated_garage, tmp_path, monkeypatch):
+        """Tests that the memory-mapped loader reads the same cars as the csv loader."""
+        monkeypatch.setattr(garage_module, "MMAP_THRESHOLD", 0)
+        file_path = tmp_path / "test_garage.csv"
+        populated_garage.save(file_path)
+
+        new_garage = Garage()
+        new_garage.load(file_path)
+        assert new_garage.cars == populated_garage.cars
+
+    def test_load_mmap_path_non_ascii(self, tmp_path, monkeypatch):
+        """Tests that non-ASCII names saved by the garage load through the memory-mapped path."""
+        monkeypatch.setattr(garage_module, "MMAP_THRESHOLD", 0)
+        file_path = tmp_path / "test_garage.csv"
+        g = Garage()
+        g.add_car(Car("Gris Platine", 2019, "Citroën", "C5 Aircross"))
+        g.add_car(Car("Weiß", 2021, "Škoda", "Octavia"))
+        g.save(file_path)
+        assert "Citroën".encode("utf-8") in file_path.read_bytes()
+
+        new_garage = Garage()
+        new_garage.load(file_path)
+        assert new_garage.cars == g.cars
+
+    def test_load_mmap_path_many_rows(self, tmp_path, monkeypatch):
+        """Tests that the memory-mapped loader grows its pre-sized list when rows are short."""
+        monkeypatch.setattr(garage_module, "MMAP_THRESHOLD", 0)
+        file_path = tmp_path / "test_garage.csv"
+        g = Garage()
+        for i in range(100):
+            g.add_car(Car("Red", 2000 + i, "VW", "Up"))
+        g.save(file_path)
+
+        new_garage = Garage()
+        new_garage.load(file_path)
+        assert new_garage.cars == g.cars
+
+    def test_load_mmap_path_quoted_fields(self, tmp_path, monkeypatch):
+        """Tests that files with quoted fields fall back to the csv module."""
+        monkeypatch.setattr(garage_module, "MMAP_THRESHOLD", 0)
+        file_path = tmp_path / "test_garage.csv"
+        g = Garage()
+        g.add_car(Car("Red, Metallic", 2022, "Ford", "Mustang"))
+        g.save(file_path)
+
+        new_garage = Garage()
+        new_garage.load(file_path)
+        assert new_garage.cars == g.cars
+
+    def test_load_mmap_path_malformed_file(self, tmp_path, monkeypatch, capsys):
+        """Tests that a corrupted file is handled gracefully by the memory-mapped loader."""
+        monkeypatch.setattr(garage_module, "MMAP_THRESHOLD", 0)
+        file_path = tmp_path / "malformed_garage.csv"
+        file_path.write_text("color,year,make,model\nRed,2022,Ford")
+
+        g = Garage()
+        g.load(file_path)
+
+        assert len(g.cars) == 0
+        assert "Error reading from" in capsys.readouterr().out
+
+    def test_flush_appends_after_adds(self, populated_garage, sample_car, tmp_path):
+        """Tests that flushing after only adds appends rows without repeating the header."""
+        file_path = tmp_path / "test_garage.csv"
+        populated_garage.save(file_path)
+        g = Garage()
+        g.load(file_path)
+
+        g.add_car(sample_car)
+        g.flush(file_path)
+
+        lines = file_path.read_text().splitlines()
+        assert lines.count("color,year,make,model") == 1
+        assert lines[-1] == "Red,2022,Ford,Mustang"
+        reloaded = Garage()
+        reloaded.load(file_path)
+        assert reloaded.cars == g.cars
+
+    def test_flush_appends_after_header_without_newline(self, sample_car, tmp_path):
+        """Tests that appending to a header-only file with no trailing newline starts a new line."""
+        file_path = tmp_path / "test_garage.csv"
+        file_path.write_text("color,year,make,model")
+        g = Garage()
+        g.load(file_path)
+
+        g.add_car(sample_car)
+        g.flush(file_path)
+
+        assert file_path.read_text().splitlines() == ["color,year,make,model", "Red,2022,Ford,Mustang"]
+        reloaded = Garage()
+        reloaded.load(file_path)
+        assert reloaded.cars == [sample_car]
+
+    def test_flush_rewrites_after_remove(self, populated_garage, sample_car, tmp_path):
+        """Tests that a removal since the last save makes flush rewrite the whole file."""
+        file_path = tmp_path / "test_garage.csv"
+        populated_garage.save(file_path)
+
+        populated_garage.remove_car(0)
+        populated_garage.add_car(sample_car)
+        populated_garage.flush(file_path)
+
+        reloaded = Garage()
+        reloaded.load(file_path)
+        assert reloaded.cars == populated_garage.cars
+
+    def test_flush_keeps_cars_added_before_load(self, populated_garage, sample_car, tmp_path):
+        """Tests that cars added before loading a file are still written by flush."""
+        file_path = tmp_path / "test_garage.csv"
+        populated_garage.save(file_path)
+        g = Garage()
+        g.add_car(sample_car)
+
+        g.load(file_path)
+        assert g.pending_changes == 1
+        g.flush(file_path)
+
+        reloaded = Garage()
+        reloaded.load(file_path)
+        assert reloaded.cars == g.cars
+        assert sample_car in reloaded.cars
+
     def test_load_non_existent_file(self, tmp_path, capsys):
         """Tests that loading a non-existent file is handled gracefully."""
         g = Garage()
@@ -110,6 +300,14 @@ class TestGarage:
 
 # --- Tests for User Interface Functions ---
 
+def test_clear_screen_writes_ansi_sequence(monkeypatch, capsys):
+    """Tests that `clear_screen` writes an escape sequence instead of running a shell command."""
+    monkeypatch.setattr('os.system', lambda _: pytest.fail("clear_screen should not spawn a process"))
+    clear_screen()
+
+    captured = capsys.readouterr()
+    assert captured.out == "\x1b[2J\x1b[H"
+
 def test_prompt_for_new_car(monkeypatch):
     """Tests the user input flow for creating a new car by mocking `input()`."""
     inputs = iter(["Green", "1998", "Honda", "Civic"])
@@ -178,4 +376,17 @@ def test_delete_car_ui_invalid_input_out_of_bounds(populated_garage, monkeypatch
     monkeypatch.setattr('builtins.input', lambda _: '99')
     delete_car(populated_garage)
     captured = capsys.readouterr()
-    assert "Invalid car number." in captured.out
\ No newline at end of file
+    assert "Invalid car number." in captured.out
+
+def test_main_does_not_clear_after_invalid_choice(tmp_path, monkeypatch):
+    """Tests that the menu only clears the screen on start-up, not after an invalid choice."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(garage_module.atexit, 'register', lambda *args: None)
+    inputs = iter(["9", "4"])
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+    clears = []
+    monkeypatch.setattr(garage_module, 'clear_screen', lambda: clears.append(True))
+
+    main()
+
+    assert len(clears) == 1